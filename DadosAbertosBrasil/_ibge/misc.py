@@ -6,14 +6,14 @@ Este submódulo é importado automaticamente com o módulo `ibge`.
 
 """
 
+import io
 from typing import Optional, Union
 
 import pandas as pd
-import requests
 
 from DadosAbertosBrasil._utils import parse
 from DadosAbertosBrasil._utils.errors import DAB_LocalidadeError
-from DadosAbertosBrasil._utils.get_data import get_data
+from DadosAbertosBrasil._utils.get_data import SESSION, get_data
 
 
 _normalize = (
@@ -80,7 +80,7 @@ def populacao(
     localidade = parse.localidade(localidade, "")
     query = f"https://servicodados.ibge.gov.br/api/v1/projecoes/populacao/{localidade}"
 
-    r = requests.get(query).json()
+    r = SESSION.get(query).json()
 
     if projecao is None:
         return r
@@ -376,7 +376,7 @@ def malha(
     url = "https://servicodados.ibge.gov.br/api/v3/"
     url += "/".join([str(p) for p in path])
 
-    data = requests.get(url=url, params=params)
+    data = SESSION.get(url=url, params=params)
 
     if formato.lower().endswith("json"):
         return data.json()
@@ -406,7 +406,6 @@ def coordenadas() -> pd.DataFrame:
 
     """
 
-    return pd.read_csv(
-        r"https://raw.githubusercontent.com/GusFurtado/dab_assets/main/data/coordenadas.csv",
-        sep=";",
-    )
+    URL = r"https://raw.githubusercontent.com/GusFurtado/dab_assets/main/data/coordenadas.csv"
+    r = SESSION.get(URL)
+    return pd.read_csv(io.BytesIO(r.content), sep=";")
@@ -9,12 +9,13 @@ Documentação Original
 https://servicodados.ibge.gov.br/api/docs
 
 """
+import io
 from typing import Optional, Union
 
 import pandas as pd
-import requests
 
 from DadosAbertosBrasil._utils import parse
+from DadosAbertosBrasil._utils.get_data import SESSION
 
 
 def nomes(
@@ -100,7 +101,7 @@ def nomes(
         params["localidade"] = parse.localidade(localidade)
 
     url = f"https://servicodados.ibge.gov.br/api/v2/censos/nomes/{nomes}"
-    data = requests.get(url, params=params).json()
+    data = SESSION.get(url, params=params).json()
     json = pd.DataFrame(data)
 
     dfs = [pd.DataFrame(json.res[i]).set_index("periodo") for i in json.index]
@@ -140,9 +141,10 @@ def nomes_uf(nome: str) -> pd.DataFrame:
 
     if isinstance(nome, str):
 
-        json = pd.read_json(
+        r = SESSION.get(
             f"https://servicodados.ibge.gov.br/api/v2/censos/nomes/{nome}?groupBy=UF"
         )
+        json = pd.read_json(io.BytesIO(r.content))
 
         df = pd.DataFrame(
             [json[json.localidade == i].res.values[0][0] for i in json.localidade]
@@ -244,4 +246,5 @@ def nomes_ranking(
     if params != "":
         query += f"?{params}"
 
-    return pd.DataFrame(pd.read_json(query).res[0]).set_index("ranking")
+    r = SESSION.get(query)
+    return pd.DataFrame(pd.read_json(io.BytesIO(r.content)).res[0]).set_index("ranking")
@@ -14,9 +14,8 @@ References
 from typing import Optional, Union
 
 import pandas as pd
-import requests
 
-from DadosAbertosBrasil._utils.get_data import get_data
+from DadosAbertosBrasil._utils.get_data import SESSION, get_data
 
 
 # Retrocompatibilidade com pandas v0.x
@@ -419,7 +418,7 @@ def sidra(
     if retorna == "url":
         return path
 
-    data = requests.get(path).json()
+    data = SESSION.get(path).json()
     if retorna == "json":
         return data
 
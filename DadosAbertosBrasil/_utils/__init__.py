@@ -2,6 +2,8 @@
 
 Módulos
 -------
+cache
+    Pacote de cache em memória e em disco dos arquivos estáticos baixados.
 errors
     Pacote de `Exceptions` exclusivas para as funções do `DadosAbertosBrasil`
 get_data
@@ -0,0 +1,305 @@
+"""Cache dos arquivos estáticos baixados pelo pacote.
+
+Os dados são mantidos em dois níveis: em memória, durante a vida do processo,
+e em disco, no diretório `CACHE_DIR`, por até `CACHE_TTL` segundos.
+
+O diretório padrão é `$XDG_CACHE_HOME/dadosabertosbrasil` (ou
+`~/.cache/dadosabertosbrasil`). Defina a variável de ambiente
+`DAB_DISK_CACHE=0` para manter o cache apenas em memória.
+
+"""
+
+import copy
+import hashlib
+import io
+import json
+import os
+import pickle
+import tempfile
+import time
+from typing import IO, Any, Callable, Iterator, Optional
+
+import requests
+
+from .get_data import SESSION
+
+
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "dadosabertosbrasil",
+)
+CACHE_TTL = 7 * 24 * 60 * 60  # 7 dias
+DISK_CACHE = os.environ.get("DAB_DISK_CACHE", "1") != "0"
+
+# Versão do formato dos objetos em cache. Deve ser incrementada sempre que a
+# função `reader` de algum `cached_get` mudar o objeto retornado (colunas,
+# tipos etc.), invalidando os arquivos gravados por versões anteriores.
+CACHE_VERSION = 1
+
+_MEMORY = {}
+
+
+def _path(key: str, ext: str = ".pkl") -> str:
+    """Caminho do arquivo em disco referente à chave `key`."""
+    name = hashlib.sha1(f"{CACHE_VERSION}:{key}".encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, f"{name}{ext}")
+
+
+def _load(path: str) -> Optional[Any]:
+    """Lê um objeto do disco, independentemente da sua idade.
+
+    Arquivos ilegíveis, por exemplo gravados com outra versão do `pandas`,
+    são removidos e tratados como ausentes.
+
+    """
+
+    try:
+        with open(path, "rb") as file:
+            return pickle.load(file)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+
+
+def _write_atomic(path: str, write: Callable[[IO[bytes]], Any]) -> None:
+    """Grava um arquivo de forma atômica.
+
+    O conteúdo é escrito em um arquivo temporário no mesmo diretório e depois
+    movido para `path`, de modo que outros processos nunca leiam um arquivo
+    incompleto.
+
+    """
+
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            write(file)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _validators(key: str) -> dict:
+    """Cabeçalhos de requisição condicional salvos para a chave `key`.
+
+    Os validadores descrevem apenas o arquivo de origem, não o objeto
+    processado; por isso são descartados se o objeto em disco tiver sido
+    gravado com outra `CACHE_VERSION`.
+
+    """
+
+    try:
+        with open(_path(key, ".meta.json"), encoding="utf-8") as file:
+            meta = json.load(file)
+    except (OSError, ValueError):
+        return {}
+    if meta.get("version") != CACHE_VERSION:
+        return {}
+
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+
+def cache_get(key: str) -> Optional[Any]:
+    """Busca um objeto no cache.
+
+    Parameters
+    ----------
+    key : str
+        Chave do objeto, normalmente a URL de origem dos dados.
+
+    Returns
+    -------
+    Any or None
+        Cópia do objeto armazenado ou None, caso ele não exista ou esteja
+        expirado.
+
+    """
+
+    if key in _MEMORY:
+        return copy.deepcopy(_MEMORY[key])
+    if not DISK_CACHE:
+        return None
+
+    path = _path(key)
+    try:
+        if time.time() - os.path.getmtime(path) > CACHE_TTL:
+            return None
+    except OSError:
+        return None
+
+    data = _load(path)
+    if data is None:
+        return None
+
+    _MEMORY[key] = data
+    return copy.deepcopy(data)
+
+
+def cache_set(
+    key: str, data: Any, response: Optional[requests.Response] = None
+) -> None:
+    """Armazena um objeto no cache.
+
+    Falhas de escrita em disco são ignoradas; nesse caso, ou se `DISK_CACHE`
+    for False, o objeto fica disponível apenas em memória.
+
+    Parameters
+    ----------
+    key : str
+        Chave do objeto, normalmente a URL de origem dos dados.
+    data : Any
+        Objeto serializável via `pickle`.
+    response : requests.Response, optional
+        Resposta HTTP que originou o objeto. Seus cabeçalhos `ETag` e
+        `Last-Modified` são salvos para revalidar o cache após o vencimento.
+
+    """
+
+    _MEMORY[key] = data
+    if not DISK_CACHE:
+        return
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        _write_atomic(
+            _path(key),
+            lambda file: pickle.dump(data, file, protocol=pickle.HIGHEST_PROTOCOL),
+        )
+        if response is not None:
+            meta = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "ts": time.time(),
+                "version": CACHE_VERSION,
+            }
+            _write_atomic(
+                _path(key, ".meta.json"),
+                lambda file: file.write(json.dumps(meta).encode("utf-8")),
+            )
+    except (OSError, pickle.PicklingError):
+        pass
+
+
+class _ChunkStream(io.RawIOBase):
+    """Stream binário somente-leitura sobre um iterador de blocos de bytes."""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._chunk = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while not self._chunk:
+            try:
+                self._chunk = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+        n = min(len(b), len(self._chunk))
+        b[:n] = self._chunk[:n]
+        self._chunk = self._chunk[n:]
+        return n
+
+
+def buffered(r: requests.Response, buffer_size: int = 256 * 1024) -> io.BufferedReader:
+    """Leitor bufferizado sobre o corpo de uma resposta em modo `stream`.
+
+    Permite que o `pandas` consuma o arquivo diretamente da conexão em
+    blocos grandes, já descomprimidos, sem copiar a resposta inteira para a
+    memória antes da leitura.
+
+    Parameters
+    ----------
+    r : requests.Response
+        Resposta obtida com `stream=True`.
+    buffer_size : int, default=262144
+        Tamanho em bytes de cada bloco lido da conexão.
+
+    Returns
+    -------
+    io.BufferedReader
+        Objeto file-like binário com o conteúdo da resposta.
+
+    """
+
+    # `iter_content` descomprime o corpo de forma consistente entre versões do
+    # `urllib3`; ler `r.raw` diretamente com `decode_content=True` pode
+    # retornar mais bytes do que o buffer comporta no `urllib3` 1.x.
+    return io.BufferedReader(
+        _ChunkStream(r.iter_content(buffer_size)), buffer_size=buffer_size
+    )
+
+
+def cached_get(
+    url: str,
+    reader: Callable[[requests.Response], Any],
+    key: Optional[str] = None,
+    stream: bool = False,
+) -> Any:
+    """Baixa e processa um arquivo, consultando antes o cache.
+
+    Caso o cache em disco esteja vencido, o arquivo é requisitado com os
+    cabeçalhos `If-None-Match` e `If-Modified-Since`. Se o servidor responder
+    304 (não modificado), a cópia em disco é renovada sem novo download.
+
+    Parameters
+    ----------
+    url : str
+        URL do arquivo.
+    reader : callable
+        Função que recebe a resposta HTTP e retorna o objeto processado.
+    key : str, optional
+        Chave do cache. Por padrão, utiliza a própria URL.
+    stream : bool, default=False
+        Se True, o corpo da resposta não é baixado antecipadamente e deve ser
+        lido por `reader` através de `response.raw` ou `buffered`.
+
+    Returns
+    -------
+    Any
+        Objeto retornado por `reader`.
+
+    """
+
+    if key is None:
+        key = url
+
+    data = cache_get(key)
+    if data is not None:
+        return data
+
+    path = _path(key)
+    headers = _validators(key) if DISK_CACHE else {}
+    stale = _load(path) if headers else None
+    if stale is None:
+        headers = {}
+
+    with SESSION.get(url, timeout=30, stream=stream, headers=headers) as r:
+        if r.status_code == 304 and stale is not None:
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+            _MEMORY[key] = stale
+            return copy.deepcopy(stale)
+
+        r.raise_for_status()
+        data = reader(r)
+        cache_set(key, data, r)
+
+    return copy.deepcopy(data)
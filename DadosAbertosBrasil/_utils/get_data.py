@@ -9,9 +9,24 @@ from typing import List, Optional, Union
 import pandas as pd
 import requests
 
+try:
+    import orjson as json
+except ImportError:
+    import json
+
 from . import errors
 
 
+# Sessão compartilhada por todas as requisições do pacote, permitindo o reuso
+# das conexões HTTP (keep-alive) entre chamadas ao mesmo servidor.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+)
+SESSION.mount(
+    "http://", requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+)
+
 _normalize = (
     pd.io.json.json_normalize if pd.__version__[0] == "0" else pd.json_normalize
 )
@@ -45,9 +60,16 @@ def get_data(
         path = [str(p) for p in path]
         path = "/".join(path)
 
-    return requests.get(
+    r = SESSION.get(
         url=endpoint + path, headers={"Accept": "application/json"}, params=params
-    ).json()
+    )
+
+    # `orjson` é mais rápido, mas só aceita UTF-8; outras codificações são
+    # tratadas pelo `requests`, que também gera o erro em caso de JSON inválido.
+    try:
+        return json.loads(r.content)
+    except ValueError:
+        return r.json()
 
 
 def get_and_format(
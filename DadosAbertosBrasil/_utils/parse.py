@@ -6,7 +6,8 @@ especiais do módulo `_utils.errors`.
 """
 
 from datetime import datetime, date
-from typing import List, Union
+import functools
+from typing import List, Optional, Union
 from unicodedata import normalize
 
 from . import errors
@@ -61,10 +62,97 @@ def data(data: Union[datetime, date, str], modulo: str) -> str:
         )
 
 
+# Nomes e códigos IBGE das UFs. As próprias siglas também são chaves da tabela,
+# para que a validação seja feita com uma única consulta ao dicionário.
+_UFS = {
+    "1": "BR",
+    "11": "RO",
+    "12": "AC",
+    "13": "AM",
+    "14": "RR",
+    "15": "PA",
+    "16": "AP",
+    "17": "TO",
+    "21": "MA",
+    "22": "PI",
+    "23": "CE",
+    "24": "RN",
+    "25": "PB",
+    "26": "PE",
+    "27": "AL",
+    "28": "SE",
+    "29": "BA",
+    "31": "MG",
+    "32": "ES",
+    "33": "RJ",
+    "35": "SP",
+    "41": "PR",
+    "42": "SC",
+    "43": "RS",
+    "50": "MS",
+    "51": "MT",
+    "52": "GO",
+    "53": "DF",
+    "BRASIL": "BR",
+    "ACRE": "AC",
+    "ALAGOAS": "AL",
+    "AMAZONAS": "AM",
+    "AMAPA": "AP",
+    "BAHIA": "BA",
+    "CEARA": "CE",
+    "DISTRITOFEDERAL": "DF",
+    "ESPIRITOSANTO": "ES",
+    "GOIAS": "GO",
+    "MARANHAO": "MA",
+    "MATOGROSSO": "MT",
+    "MATOGROSSODOSUL": "MS",
+    "MINASGERAIS": "MG",
+    "MINAS": "MG",
+    "PARA": "PA",
+    "PARAIBA": "PB",
+    "PARANA": "PR",
+    "PERNAMBUCO": "PE",
+    "PIAUI": "PI",
+    "RIODEJANEIRO": "RJ",
+    "RIO": "RJ",
+    "RIOGRANDEDONORTE": "RN",
+    "RIOGRANDEDOSUL": "RS",
+    "RONDONIA": "RO",
+    "RORAIMA": "RR",
+    "SAOPAULO": "SP",
+    "SANTACATARINA": "SC",
+    "SERGIPE": "SE",
+    "TOCANTINS": "TO",
+}
+_UFS.update({sigla: sigla for sigla in set(_UFS.values())})
+
+_UFS_EXTINTOS = {
+    **_UFS,
+    "20": "FN",
+    "34": "GB",
+    "FERNANDODENORONHA": "FN",
+    "GUANABARA": "GB",
+    "FN": "FN",
+    "GB": "GB",
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _uf_key(key: str, extintos: bool) -> Optional[str]:
+    """Sigla da UF referente à chave textual `key`, ou None se inválida."""
+    _uf = key.upper().replace(" ", "")
+    _uf = normalize("NFKD", _uf).encode("ASCII", "ignore").decode("ASCII")
+    return (_UFS_EXTINTOS if extintos else _UFS).get(_uf)
+
+
 def uf(uf: Union[str, int], extintos: bool = False) -> str:
     """Converte os nomes dos estados em siglas padrões.
     Suporta abreviaturas, acentuação e case sensibility.
 
+    A normalização é memoizada a partir da representação textual de `uf`,
+    pois há poucas entradas válidas e a função é chamada repetidamente pelos
+    demais módulos.
+
     Parametros
     ----------
     uf: str | int
@@ -82,89 +170,12 @@ def uf(uf: Union[str, int], extintos: bool = False) -> str:
 
     """
 
-    UFS = {
-        "1": "BR",
-        "11": "RO",
-        "12": "AC",
-        "13": "AM",
-        "14": "RR",
-        "15": "PA",
-        "16": "AP",
-        "17": "TO",
-        "21": "MA",
-        "22": "PI",
-        "23": "CE",
-        "24": "RN",
-        "25": "PB",
-        "26": "PE",
-        "27": "AL",
-        "28": "SE",
-        "29": "BA",
-        "31": "MG",
-        "32": "ES",
-        "33": "RJ",
-        "35": "SP",
-        "41": "PR",
-        "42": "SC",
-        "43": "RS",
-        "50": "MS",
-        "51": "MT",
-        "52": "GO",
-        "53": "DF",
-        "BRASIL": "BR",
-        "ACRE": "AC",
-        "ALAGOAS": "AL",
-        "AMAZONAS": "AM",
-        "AMAPA": "AP",
-        "BAHIA": "BA",
-        "CEARA": "CE",
-        "DISTRITOFEDERAL": "DF",
-        "ESPIRITOSANTO": "ES",
-        "GOIAS": "GO",
-        "MARANHAO": "MA",
-        "MATOGROSSO": "MT",
-        "MATOGROSSODOSUL": "MS",
-        "MINASGERAIS": "MG",
-        "MINAS": "MG",
-        "PARA": "PA",
-        "PARAIBA": "PB",
-        "PARANA": "PR",
-        "PERNAMBUCO": "PE",
-        "PIAUI": "PI",
-        "RIODEJANEIRO": "RJ",
-        "RIO": "RJ",
-        "RIOGRANDEDONORTE": "RN",
-        "RIOGRANDEDOSUL": "RS",
-        "RONDONIA": "RO",
-        "RORAIMA": "RR",
-        "SAOPAULO": "SP",
-        "SANTACATARINA": "SC",
-        "SERGIPE": "SE",
-        "TOCANTINS": "TO",
-    }
-
-    _uf = str(uf).upper().replace(" ", "")
-    _uf = normalize("NFKD", _uf).encode("ASCII", "ignore").decode("ASCII")
-
-    if extintos:
-        UFS.update(
-            {
-                "20": "FN",
-                "34": "GB",
-                "FERNANDODENORONHA": "FN",
-                "GUANABARA": "GB",
-            }
+    _uf = _uf_key(str(uf), bool(extintos))
+    if _uf is None:
+        raise errors.DAB_UFError(
+            f"UF {uf} não identificada.\n" "Insira uma UF válida."
         )
-
-    if _uf in UFS.values():
-        return _uf
-    else:
-        try:
-            return UFS[_uf]
-        except KeyError:
-            raise errors.DAB_UFError(
-                f"UF {uf} não identificada.\n" "Insira uma UF válida."
-            )
+    return _uf
 
 
 def localidade(localidade: str, brasil=1, on_error="raise") -> str:
@@ -9,18 +9,126 @@ interesse público.
 
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Union, Optional
+import functools
+import os
+from typing import Dict, List, Optional, Tuple, Union
 import warnings
 
 import pandas as pd
-import requests
+
+try:
+    import orjson as json
+except ImportError:
+    import json
+
+try:
+    import pyarrow  # noqa: F401
+except ImportError:
+    _PYARROW = False
+else:
+    _PYARROW = True
+
+# `engine='pyarrow'` exige pandas 1.4+, `string[pyarrow]` exige pandas 1.3+ e
+# o tipo `string` exige pandas 1.0+.
+_PD_VERSION = tuple(int(v) for v in pd.__version__.split(".")[:2])
+_CSV_ENGINE = "pyarrow" if _PYARROW and _PD_VERSION >= (1, 4) else "c"
+if _PYARROW and _PD_VERSION >= (1, 3):
+    _STRING_DTYPE = "string[pyarrow]"
+elif _PD_VERSION >= (1, 0):
+    _STRING_DTYPE = "string"
+else:
+    _STRING_DTYPE = "object"
 
 from ._utils import parse
+from ._utils.cache import buffered, cached_get
 from . import bacen
 from . import ipea
 
 
+__all__ = [
+    "bandeira",
+    "brasao",
+    "catalogo",
+    "codigos_municipios",
+    "ipca",
+    "painel_macro",
+    "perfil_eleitorado",
+    "pib",
+    "rentabilidade_poupanca",
+    "reservas_internacionais",
+    "risco_brasil",
+    "salario_minimo",
+    "selic",
+    "taxa_referencial",
+]
+
+_WIKIMEDIA_URL = r"https://upload.wikimedia.org/wikipedia/commons/thumb/"
+
+
+def _load_wikimedia_table() -> Dict[str, Dict[str, Tuple[str, str]]]:
+    """Lê o diretório e o nome do arquivo original de cada imagem na
+    WikiMedia, armazenados em `data/wikimedia.tsv`.
+
+    Returns
+    -------
+    dict
+        Dicionário no formato `{tipo: {uf: (folder, arquivo)}}`, onde `tipo`
+        é 'bandeira' ou 'brasao'.
+
+    """
+
+    path = os.path.join(os.path.dirname(__file__), "data", "wikimedia.tsv")
+    tabela = {}
+    with open(path, encoding="utf-8") as file:
+        next(file)  # Cabeçalho
+        for line in file:
+            uf, tipo, folder, arquivo = line.rstrip("\n").split("\t")
+            tabela.setdefault(tipo, {})[uf] = (folder, arquivo)
+    return tabela
+
+
+_WIKIMEDIA = _load_wikimedia_table()
+_BANDEIRAS = _WIKIMEDIA["bandeira"]
+_BRASOES = _WIKIMEDIA["brasao"]
+
+
+# Colunas de baixa cardinalidade de `perfil_eleitorado`.
+_PERFIL_CAT_COLS = [
+    "NR_ANO_ELEICAO",
+    "CD_PAIS",
+    "NM_PAIS",
+    "SG_REGIAO",
+    "NM_REGIAO",
+    "SG_UF",
+    "NM_UF",
+]
+
+# Códigos das séries de `reservas_internacionais` (SGS) por período.
+_RESERVAS_CODE = {
+    "mensal": 3546,
+    "diaria": 13621,
+    "diario": 13621,
+    "diária": 13621,
+    "diário": 13621,
+}
+
+# Códigos das séries de `salario_minimo` (IpeaData) por tipo.
+_SALMIN_CODE = {
+    "nominal": "MTE12_SALMIN12",
+    "real": "GAC12_SALMINRE12",
+    "ppc": "GAC12_SALMINDOL12",
+}
+
+
+def _wikimedia_url(folder: str, arquivo: str, tamanho: int) -> str:
+    """Monta a URL da miniatura PNG de um arquivo da WikiMedia."""
+    miniatura = arquivo if arquivo.endswith(".png") else f"{arquivo}.png"
+    return f"{_WIKIMEDIA_URL}{folder}/{arquivo}/{tamanho}px-{miniatura}"
+
+
+@functools.lru_cache(maxsize=512, typed=True)
 def bandeira(uf: str, tamanho: int = 100) -> str:
     """Gera a URL da WikiMedia para a bandeira de um estado.
 
@@ -50,45 +158,11 @@ def bandeira(uf: str, tamanho: int = 100) -> str:
 
     """
 
-    URL = r"https://upload.wikimedia.org/wikipedia/commons/thumb/"
-
-    bandeira = {
-        "BR": f"0/05/Flag_of_Brazil.svg/{tamanho}px-Flag_of_Brazil.svg.png",
-        "AC": f"4/4c/Bandeira_do_Acre.svg/{tamanho}px-Bandeira_do_Acre.svg.png",
-        "AM": f"6/6b/Bandeira_do_Amazonas.svg/{tamanho}px-Bandeira_do_Amazonas.svg.png",
-        "AL": f"8/88/Bandeira_de_Alagoas.svg/{tamanho}px-Bandeira_de_Alagoas.svg.png",
-        "AP": f"0/0c/Bandeira_do_Amap%C3%A1.svg/{tamanho}px-Bandeira_do_Amap%C3%A1.svg.png",
-        "BA": f"2/28/Bandeira_da_Bahia.svg/{tamanho}px-Bandeira_da_Bahia.svg.png",
-        "CE": f"2/2e/Bandeira_do_Cear%C3%A1.svg/{tamanho}px-Bandeira_do_Cear%C3%A1.svg.png",
-        "DF": f"3/3c/Bandeira_do_Distrito_Federal_%28Brasil%29.svg/{tamanho}px-Bandeira_do_Distrito_Federal_%28Brasil%29.svg.png",
-        "ES": f"4/43/Bandeira_do_Esp%C3%ADrito_Santo.svg/{tamanho}px-Bandeira_do_Esp%C3%ADrito_Santo.svg.png",
-        "GO": f"b/be/Flag_of_Goi%C3%A1s.svg/{tamanho}px-Flag_of_Goi%C3%A1s.svg.png",
-        "MA": f"4/45/Bandeira_do_Maranh%C3%A3o.svg/{tamanho}px-Bandeira_do_Maranh%C3%A3o.svg.png",
-        "MG": f"f/f4/Bandeira_de_Minas_Gerais.svg/{tamanho}px-Bandeira_de_Minas_Gerais.svg.png",
-        "MT": f"0/0b/Bandeira_de_Mato_Grosso.svg/{tamanho}px-Bandeira_de_Mato_Grosso.svg.png",
-        "MS": f"6/64/Bandeira_de_Mato_Grosso_do_Sul.svg/{tamanho}px-Bandeira_de_Mato_Grosso_do_Sul.svg.png",
-        "PA": f"0/02/Bandeira_do_Par%C3%A1.svg/{tamanho}px-Bandeira_do_Par%C3%A1.svg.png",
-        "PB": f"b/bb/Bandeira_da_Para%C3%ADba.svg/{tamanho}px-Bandeira_da_Para%C3%ADba.svg.png",
-        "PE": f"5/59/Bandeira_de_Pernambuco.svg/{tamanho}px-Bandeira_de_Pernambuco.svg.png",
-        "PI": f"3/33/Bandeira_do_Piau%C3%AD.svg/{tamanho}px-Bandeira_do_Piau%C3%AD.svg.png",
-        "PR": f"9/93/Bandeira_do_Paran%C3%A1.svg/{tamanho}px-Bandeira_do_Paran%C3%A1.svg.png",
-        "RJ": f"7/73/Bandeira_do_estado_do_Rio_de_Janeiro.svg/{tamanho}px-Bandeira_do_estado_do_Rio_de_Janeiro.svg.png",
-        "RO": f"f/fa/Bandeira_de_Rond%C3%B4nia.svg/{tamanho}px-Bandeira_de_Rond%C3%B4nia.svg.png",
-        "RN": f"3/30/Bandeira_do_Rio_Grande_do_Norte.svg/{tamanho}px-Bandeira_do_Rio_Grande_do_Norte.svg.png",
-        "RR": f"9/98/Bandeira_de_Roraima.svg/{tamanho}px-Bandeira_de_Roraima.svg.png",
-        "RS": f"6/63/Bandeira_do_Rio_Grande_do_Sul.svg/{tamanho}px-Bandeira_do_Rio_Grande_do_Sul.svg.png",
-        "SC": f"1/1a/Bandeira_de_Santa_Catarina.svg/{tamanho}px-Bandeira_de_Santa_Catarina.svg.png",
-        "SE": f"b/be/Bandeira_de_Sergipe.svg/{tamanho}px-Bandeira_de_Sergipe.svg.png",
-        "SP": f"2/2b/Bandeira_do_estado_de_S%C3%A3o_Paulo.svg/{tamanho}px-Bandeira_do_estado_de_S%C3%A3o_Paulo.svg.png",
-        "TO": f"f/ff/Bandeira_do_Tocantins.svg/{tamanho}px-Bandeira_do_Tocantins.svg.png",
-        # Extintos
-        "FN": f"3/3b/Fernando_de_Noronha%2C_PE_-_Bandeira.svg/{tamanho}px-Fernando_de_Noronha%2C_PE_-_Bandeira.svg.png",
-        "GB": f"c/c3/Bandeira_do_Estado_da_Guanabara_%281960%E2%80%931975%29.png/{tamanho}px-Bandeira_do_Estado_da_Guanabara_%281960%E2%80%931975%29.png",
-    }
-
-    return URL + bandeira[parse.uf(uf, extintos=True)]
+    folder, arquivo = _BANDEIRAS[parse.uf(uf, extintos=True)]
+    return _wikimedia_url(folder, arquivo, tamanho)
 
 
+@functools.lru_cache(maxsize=512, typed=True)
 def brasao(uf: str, tamanho: int = 100) -> str:
     """Gera a URL da WikiMedia para o brasão de um estado.
 
@@ -118,43 +192,8 @@ def brasao(uf: str, tamanho: int = 100) -> str:
 
     """
 
-    URL = r"https://upload.wikimedia.org/wikipedia/commons/thumb/"
-
-    brasao = {
-        "BR": f"b/bf/Coat_of_arms_of_Brazil.svg/{tamanho}px-Coat_of_arms_of_Brazil.svg.png",
-        "AC": f"5/52/Brasão_do_Acre.svg/{tamanho}px-Brasão_do_Acre.svg.png",
-        "AM": f"2/2c/Bras%C3%A3o_do_Amazonas.svg/{tamanho}px-Bras%C3%A3o_do_Amazonas.svg.png",
-        "AL": f"5/5c/Bras%C3%A3o_do_Estado_de_Alagoas.svg/{tamanho}px-Bras%C3%A3o_do_Estado_de_Alagoas.svg.png",
-        "AP": f"6/63/Bras%C3%A3o_do_Amap%C3%A1.svg/{tamanho}px-Bras%C3%A3o_do_Amap%C3%A1.svg.png",
-        "BA": f"1/12/Bras%C3%A3o_do_estado_da_Bahia.svg/{tamanho}px-Bras%C3%A3o_do_estado_da_Bahia.svg.png",
-        "CE": f"f/fe/Bras%C3%A3o_do_Cear%C3%A1.svg/{tamanho}px-Bras%C3%A3o_do_Cear%C3%A1.svg.png",
-        "DF": f"e/e0/Bras%C3%A3o_do_Distrito_Federal_%28Brasil%29.svg/{tamanho}px-Bras%C3%A3o_do_Distrito_Federal_%28Brasil%29.svg.png",
-        "ES": f"a/a0/Bras%C3%A3o_do_Esp%C3%ADrito_Santo.svg/{tamanho}px-Bras%C3%A3o_do_Esp%C3%ADrito_Santo.svg.png",
-        "GO": f"b/bf/Bras%C3%A3o_de_Goi%C3%A1s.svg/{tamanho}px-Bras%C3%A3o_de_Goi%C3%A1s.svg.png",
-        "MA": f"a/ab/Brasão_do_Maranhão.svg/{tamanho}px-Brasão_do_Maranhão.svg.png",
-        "MG": f"d/d2/Brasão_de_Minas_Gerais.svg/{tamanho}px-Brasão_de_Minas_Gerais.svg.png",
-        "MT": f"0/04/Brasão_de_Mato_Grosso.png/{tamanho}px-Brasão_de_Mato_Grosso.png",
-        "MS": f"f/fa/Brasão_de_Mato_Grosso_do_Sul.svg/{tamanho}px-Brasão_de_Mato_Grosso_do_Sul.svg.png",
-        "PA": f"b/bc/Brasão_do_Pará.svg/{tamanho}px-Brasão_do_Pará.svg.png",
-        "PB": f"f/fd/Brasão_da_Paraíba.svg/{tamanho}px-Brasão_da_Paraíba.svg.png",
-        "PE": f"0/04/Brasão_do_estado_de_Pernambuco.svg/{tamanho}px-Brasão_do_estado_de_Pernambuco.svg.png",
-        "PI": f"a/ad/Brasão_do_Piauí.svg/{tamanho}px-Brasão_do_Piauí.svg.png",
-        "PR": f"4/49/Brasão_do_Paraná.svg/{tamanho}px-Brasão_do_Paraná.svg.png",
-        "RJ": f"5/5b/Brasão_do_estado_do_Rio_de_Janeiro.svg/{tamanho}px-Brasão_do_estado_do_Rio_de_Janeiro.svg.png",
-        "RO": f"f/f1/Brasão_de_Rondônia.svg/{tamanho}px-Brasão_de_Rondônia.svg.png",
-        "RN": f"2/26/Brasão_do_Rio_Grande_do_Norte.svg/{tamanho}px-Brasão_do_Rio_Grande_do_Norte.svg.png",
-        "RR": f"e/ed/Brasão_de_Roraima.svg/{tamanho}px-Brasão_de_Roraima.svg.png",
-        "RS": f"3/38/Brasão_do_Rio_Grande_do_Sul.svg/{tamanho}px-Brasão_do_Rio_Grande_do_Sul.svg.png",
-        "SC": f"6/65/Brasão_de_Santa_Catarina.svg/{tamanho}px-Brasão_de_Santa_Catarina.svg.png",
-        "SE": f"5/52/Brasão_de_Sergipe.svg/{tamanho}px-Brasão_de_Sergipe.svg.png",
-        "SP": f"1/1a/Brasão_do_estado_de_São_Paulo.svg/{tamanho}px-Brasão_do_estado_de_São_Paulo.svg.png",
-        "TO": f"c/cc/Brasão_do_Tocantins.svg/{tamanho}px-Brasão_do_Tocantins.svg.png",
-        # Extintos
-        "FN": f"5/5a/Fernando_de_Noronha%2C_PE_-_Bras%C3%A3o.svg/{tamanho}px-Fernando_de_Noronha%2C_PE_-_Bras%C3%A3o.svg.png",
-        "GB": f"c/cf/Bras%C3%A3o_do_Estado_da_Guanabara_%281960%E2%80%931975%29.png/{tamanho}px-Bras%C3%A3o_do_Estado_da_Guanabara_%281960%E2%80%931975%29.png",
-    }
-
-    return URL + brasao[parse.uf(uf, extintos=True)]
+    folder, arquivo = _BRASOES[parse.uf(uf, extintos=True)]
+    return _wikimedia_url(folder, arquivo, tamanho)
 
 
 def catalogo() -> pd.DataFrame:
@@ -183,7 +222,7 @@ def catalogo() -> pd.DataFrame:
     """
 
     URL = "https://raw.githubusercontent.com/dadosgovbr/catalogos-dados-brasil/master/dados/catalogos.csv"
-    return pd.read_csv(URL)
+    return cached_get(URL, lambda r: pd.read_csv(buffered(r)), stream=True)
 
 
 def codigos_municipios() -> pd.DataFrame:
@@ -195,7 +234,11 @@ def codigos_municipios() -> pd.DataFrame:
     -------
     pandas.core.frame.DataFrame
         DataFrame contendo os códigos do IBGE e do TSE para todos os
-        municípios do Brasil.
+        municípios do Brasil, com os seguintes tipos:
+            - `codigo_tse` e `codigo_ibge`: int32;
+            - `nome_municipio`: string (string[pyarrow], se disponível);
+            - `uf`: category;
+            - `capital`: int8 (1 para capitais, 0 para os demais).
 
     References
     ----------
@@ -215,8 +258,23 @@ def codigos_municipios() -> pd.DataFrame:
     """
 
     URL = r"https://raw.githubusercontent.com/betafcc/Municipios-Brasileiros-TSE/master/municipios_brasileiros_tse.json"
-    df = pd.read_json(URL)
-    return df[["codigo_tse", "codigo_ibge", "nome_municipio", "uf", "capital"]]
+
+    def reader(r):
+        df = pd.DataFrame.from_records(
+            json.loads(r.content),
+            columns=["codigo_tse", "codigo_ibge", "nome_municipio", "uf", "capital"],
+        )
+        return df.astype(
+            {
+                "codigo_tse": "int32",
+                "codigo_ibge": "int32",
+                "nome_municipio": _STRING_DTYPE,
+                "uf": "category",
+                "capital": "int8",
+            }
+        )
+
+    return cached_get(URL, reader)
 
 
 def ipca(
@@ -284,13 +342,106 @@ def ipca(
     return bacen.serie(cod=433, ultimos=ultimos, inicio=inicio, fim=fim, index=index)
 
 
-def perfil_eleitorado() -> pd.DataFrame:
+def painel_macro(
+    ultimos: Optional[int] = None,
+    inicio: Union[datetime, str] = None,
+    fim: Union[datetime, str] = None,
+    index: bool = False,
+) -> Dict[str, pd.DataFrame]:
+    """Principais indicadores macroeconômicos em uma única consulta.
+
+    Coleta em paralelo as séries das funções `ipca`, `selic`,
+    `taxa_referencial`, `rentabilidade_poupanca`, `reservas_internacionais`,
+    `risco_brasil` e `salario_minimo`, utilizando os valores padrões de cada
+    uma delas.
+
+    Parameters
+    ----------
+    ultimos : int, optional
+        Retorna os últimos N valores de cada série do módulo `bacen`.
+    inicio : datetime or str, optional
+        Valor datetime ou string no formato de data 'AAAA-MM-DD' que
+        representa o primeiro dia da pesquisa nas séries do módulo `bacen`.
+    fim : datetime or str, optional
+        Valor datetime ou string no formato de data 'AAAA-MM-DD' que
+        representa o último dia da pesquisa nas séries do módulo `bacen`.
+        Caso este campo seja None, será considerada a data de hoje.
+    index : bool, default=False
+        Define a coluna `data` como index das tabelas.
+
+    Returns
+    -------
+    dict of pandas.core.frame.DataFrame
+        Dicionário cujas chaves são os nomes das funções e os valores são as
+        tabelas retornadas por elas.
+
+    Raises
+    ------
+    JSONDecodeError
+        Em caso de falha na consulta de alguma das séries.
+
+    Notes
+    -----
+    Os argumentos `ultimos`, `inicio` e `fim` são aplicados apenas às séries
+    do Banco Central (`ipca`, `selic`, `taxa_referencial`,
+    `rentabilidade_poupanca` e `reservas_internacionais`). As séries do
+    IpeaData (`risco_brasil` e `salario_minimo`) são sempre completas.
+
+    As consultas são feitas em threads que compartilham a mesma
+    `requests.Session` do pacote. A `Session` não é documentada como
+    thread-safe pelo `requests`; ela é usada aqui apenas para requisições GET
+    independentes, sem cookies ou autenticação, cujo pool de conexões do
+    `urllib3` é seguro entre threads.
+
+    Examples
+    --------
+    Os últimos 12 valores das séries do Banco Central.
+
+    >>> painel = favoritos.painel_macro(ultimos=12)
+    >>> painel['selic']
+                data  valor
+    0     2021-03-17  ...
+    ..           ...    ...
+
+    """
+
+    janela = {"ultimos": ultimos, "inicio": inicio, "fim": fim, "index": index}
+    funcs = {
+        "ipca": (ipca, janela),
+        "selic": (selic, janela),
+        "taxa_referencial": (taxa_referencial, janela),
+        "rentabilidade_poupanca": (rentabilidade_poupanca, janela),
+        "reservas_internacionais": (reservas_internacionais, janela),
+        "risco_brasil": (risco_brasil, {"index": index}),
+        "salario_minimo": (salario_minimo, {"index": index}),
+    }
+
+    with ThreadPoolExecutor(max_workers=len(funcs)) as executor:
+        futures = {
+            nome: executor.submit(func, **kwargs)
+            for nome, (func, kwargs) in funcs.items()
+        }
+        return {nome: future.result() for nome, future in futures.items()}
+
+
+def perfil_eleitorado(colunas: Optional[List[Union[str, int]]] = None) -> pd.DataFrame:
     """Tabela com perfil do eleitorado por município.
 
+    Parameters
+    ----------
+    colunas : list of str or list of int, optional
+        Lista dos nomes ou das posições das colunas que serão lidas, em
+        qualquer ordem. Se None, retorna todas as colunas.
+        Selecionar apenas as colunas necessárias reduz o tempo de leitura e o
+        consumo de memória.
+
     Returns
     -------
     pandas.core.frame.DataFrame
         DataFrame contendo o perfil do eleitorado em todos os municípios.
+        As colunas de baixa cardinalidade (ano, país, região e UF) são do tipo
+        `category` e as colunas de inteiros, como códigos e quantidades de
+        eleitores, são do tipo int32.
 
     Examples
     --------
@@ -300,13 +451,40 @@ def perfil_eleitorado() -> pd.DataFrame:
     1               2020        1  Brasil         N     Norte    AC      Acre  ...
     ..               ...      ...     ...       ...       ...   ...       ...  ...
 
+    Apenas a quantidade de eleitores por UF.
+
+    >>> favoritos.perfil_eleitorado(colunas=['SG_UF', 'QT_ELEITORES_PERFIL'])
+          SG_UF  QT_ELEITORES_PERFIL
+    0        AC                  ...
+    1        AC                  ...
+    ..      ...                  ...
+
     """
 
-    return pd.read_csv(
-        r"https://raw.githubusercontent.com/GusFurtado/dab_assets/main/data/eleitorado.csv",
-        encoding="latin-1",
-        sep=";",
-    )
+    URL = r"https://raw.githubusercontent.com/GusFurtado/dab_assets/main/data/eleitorado.csv"
+    if colunas is None:
+        key = URL
+        engine = _CSV_ENGINE
+    else:
+        key = f"{URL}?colunas={','.join(sorted(map(repr, colunas)))}"
+        # O engine 'pyarrow' não aceita posições inteiras em `usecols`.
+        engine = _CSV_ENGINE if all(isinstance(c, str) for c in colunas) else "c"
+
+    def reader(r):
+        df = pd.read_csv(
+            buffered(r),
+            encoding="latin-1",
+            sep=";",
+            engine=engine,
+            usecols=colunas,
+        )
+        ints = df.select_dtypes("int64")
+        int32 = (ints.min() >= -(2**31)) & (ints.max() < 2**31)
+        dtypes = {col: "int32" for col in int32[int32].index}
+        dtypes.update({col: "category" for col in _PERFIL_CAT_COLS if col in df})
+        return df.astype(dtypes)
+
+    return cached_get(URL, reader, key=key, stream=True)
 
 
 def pib(periodo: str = "anual", index: bool = False) -> pd.DataFrame:
@@ -507,19 +685,14 @@ def reservas_internacionais(
 
     """
 
-    if periodo.lower() == "mensal":
-        return bacen.serie(
-            cod=3546, ultimos=ultimos, inicio=inicio, fim=fim, index=index
-        )
-    elif periodo.lower() in ["diaria", "diario", "diário", "diária"]:
-        return bacen.serie(
-            cod=13621, ultimos=ultimos, inicio=inicio, fim=fim, index=index
-        )
-    else:
+    cod = _RESERVAS_CODE.get(periodo.lower())
+    if cod is None:
         raise ValueError(
             "Período inválido. Escolha um dos seguintes valores: 'mensal' ou 'diaria'."
         )
 
+    return bacen.serie(cod=cod, ultimos=ultimos, inicio=inicio, fim=fim, index=index)
+
 
 def risco_brasil(index: bool = False) -> pd.DataFrame:
     """Valores diários do Risco-Brasil, disponibilizados pela J.P. Morgan
@@ -605,17 +778,13 @@ def salario_minimo(tipo: str = "nominal", index: bool = False) -> pd.DataFrame:
 
     """
 
-    if tipo.lower() == "nominal":
-        df = ipea.serie(cod="MTE12_SALMIN12", index=False)
-    elif tipo.lower() == "real":
-        df = ipea.serie(cod="GAC12_SALMINRE12", index=False)
-    elif tipo.lower() == "ppc":
-        df = ipea.serie(cod="GAC12_SALMINDOL12", index=False)
-    else:
+    cod = _SALMIN_CODE.get(tipo.lower())
+    if cod is None:
         raise ValueError(
             "Tipo inválido. Escolha um dos seguintes valores: 'nominal', 'real' ou 'ppc'."
         )
 
+    df = ipea.serie(cod=cod, index=False)
     df.drop(columns=["codigo", "nivel", "territorio"], inplace=True)
     if index:
         df.set_index("data", inplace=True)
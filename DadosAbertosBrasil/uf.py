@@ -9,7 +9,6 @@ import json
 from typing import Dict, Optional, Union
 
 from pandas import DataFrame
-import requests
 
 from . import ibge
 from . import favoritos
@@ -17,6 +16,7 @@ from .camara import lista_deputados
 from .senado import lista_senadores
 from ._utils.errors import DAB_UFError
 from ._utils import parse
+from ._utils.get_data import SESSION
 
 
 class Governador:
@@ -71,7 +71,7 @@ class Governador:
 
         # Baixar dados
         URL = r"https://raw.githubusercontent.com/GusFurtado/dab_assets/main/data/governadores.json"
-        r = requests.get(URL)
+        r = SESSION.get(URL)
         data = json.loads(r.json())[self._UFS[self.uf]]
 
         # Criar atributos
@@ -163,7 +163,7 @@ class UF:
     def _get_data(self) -> dict:
         """Buscar dados de UFs em `dab_assets`."""
         URL = r"https://raw.githubusercontent.com/GusFurtado/dab_assets/main/data/ufs.json"
-        r = requests.get(URL)
+        r = SESSION.get(URL)
         return r.json()[self.sigla]
 
     def bandeira(self, tamanho: int = 100) -> str:
@@ -42,6 +42,7 @@ setup(
         "DadosAbertosBrasil._utils",
         "DadosAbertosBrasil._ibge",
     ],
+    package_data={"DadosAbertosBrasil": ["data/*.tsv"]},
     version=get_version(),
     license="MIT",
     description="Pacote Python para acesso a dados abertos e APIs do governo brasileiro.",